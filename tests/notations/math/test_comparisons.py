@@ -61,6 +61,10 @@ references = {
             f"created_at={references['datetime'][0]}",
             operators.EQ(references['datetime'][1])
         ),
+        (
+            "created_at=04/04/2024 11:04:02",
+            operators.EQ(references['datetime'][1])
+        ),
         (
             f"birthday={references['date'][0]}",
             operators.EQ(references['date'][1])
@@ -77,6 +81,18 @@ references = {
             f"is_active={references['bool_negative'][0]}",
             operators.EQ(references['bool_negative'][1])
         ),
+        (
+            f"amount=!{references['int'][0]}",
+            operators.NOT(operators.EQ(references['int'][1]))
+        ),
+        (
+            "is_active=TRUE",
+            operators.EQ(True)
+        ),
+        (
+            "annotation=nothing",
+            operators.EQ("nothing")
+        ),
         (
             "item_id=null",
             operators.IS(None)
@@ -111,3 +127,107 @@ def test_comparisons(
 ):
     result = next(parser(data, types_map), None)
     assert result[1] == value
+
+
+def test_multiple_params(
+    parser,
+    types_map
+):
+    result = list(parser("amount=12&name=~abc&limit=10", types_map))
+    assert result[0] == ('amount', operators.EQ(12))
+    assert result[1] == ('name', operators.LIKE('abc', case_sensitive=True))
+    assert result[2][0] == 'limit'
+    assert result[2][1].value == 10
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "amount=1&name",
+        "=5&amount=1",
+        "&amount=1",
+        "amount=1&&amount=2",
+        "amount=1&",
+    ]
+)
+def test_malformed_query(
+    parser,
+    types_map,
+    data: str
+):
+    with pytest.raises(ValueError):
+        list(parser(data, types_map))
+
+
+def test_value_with_equal_sign(
+    parser,
+    types_map
+):
+    result = list(parser("annotation=a=b&amount=1", types_map))
+    assert result[0] == ('annotation', operators.EQ("a=b"))
+    assert result[1] == ('amount', operators.EQ(1))
+
+
+def test_casters_follow_types_map_changes(parser):
+    types_map = dict(value=int)
+    assert next(parser("value=1", types_map))[1] == operators.EQ(1)
+    types_map['value'] = float
+    result = next(parser("value=1", types_map))[1]
+    assert isinstance(result.value, float)
+    types_map['name'] = str
+    assert next(parser("name=x", types_map))[1] == operators.EQ("x")
+
+
+def test_parse_all(
+    parser,
+    types_map
+):
+    result = parser.parse_all(dict(amount="12", order_by="-price,name", offset="5"), types_map)
+    assert result[0] == ('amount', operators.EQ(12))
+    assert [name for name, _ in result[1:3]] == ['price', 'name']
+    assert isinstance(result[1][1], operators.DESC)
+    assert isinstance(result[2][1], operators.ASC)
+    assert result[3][0] == 'offset'
+    assert result[3][1].value == 5
+
+
+def test_cache_clear(
+    parser,
+    types_map
+):
+    parser.cache_clear()
+    first = next(parser(f"created_at={references['datetime'][0]}", types_map))[1]
+    second = next(parser(f"created_at={references['datetime'][0]}", types_map))[1]
+    assert first.value is second.value
+    parser.cache_clear()
+    third = next(parser(f"created_at={references['datetime'][0]}", types_map))[1]
+    assert third.value == first.value
+    assert third.value is not first.value
+
+
+def test_non_iso_datetime_is_not_cached(
+    parser,
+    types_map,
+    monkeypatch
+):
+    parser.cache_clear()
+    monkeypatch.setattr(
+        "dateutil.parser.parse",
+        lambda value: datetime.datetime(2024, 4, 4, 10, 0)
+    )
+    first = next(parser("created_at=10:00", types_map))[1]
+    monkeypatch.setattr(
+        "dateutil.parser.parse",
+        lambda value: datetime.datetime(2024, 4, 5, 10, 0)
+    )
+    second = next(parser("created_at=10:00", types_map))[1]
+    assert first.value == datetime.datetime(2024, 4, 4, 10, 0)
+    assert second.value == datetime.datetime(2024, 4, 5, 10, 0)
+
+
+def test_multiline_value(
+    parser,
+    types_map
+):
+    result = next(parser(dict(annotation="~first\nsecond"), types_map))
+    assert result[1] == operators.LIKE("first\nsecond", case_sensitive=True)
@@ -166,3 +166,27 @@ def test_opened_interval(
     left_instance, right_instance = range_param.value
     assert left_instance == left_bound
     assert right_instance == right_bound
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        'amount=(1)',
+        'amount=(1,2,3)',
+    ]
+)
+def test_interval_members_count(
+    parser,
+    types_map,
+    data: str
+):
+    with pytest.raises(ValueError):
+        next(parser(data, types_map), None)
+
+
+def test_interval_type(
+    parser,
+    types_map
+):
+    with pytest.raises(TypeError):
+        next(parser('name=(1,3)', types_map), None)
@@ -51,3 +51,13 @@ def test_set(
     param = next(parser(data, types_map), None)
     assert isinstance(param[1], operators.SET)
     assert param[1].value == values
+
+
+def test_inverted_set(
+    parser,
+    types_map
+):
+    param = next(parser("amount=!{1,2}", types_map), None)
+    assert isinstance(param[1], operators.NOT)
+    assert isinstance(param[1].value, operators.SET)
+    assert param[1].value.value == {1, 2}
@@ -8,7 +8,23 @@ import types
 import dateutil.parser
 import functools
 
-from zodchy import codex, operators
+from zodchy import codex
+from zodchy.operators import (
+    ASC,
+    DESC,
+    EQ,
+    GE,
+    GT,
+    IS,
+    LE,
+    LIKE,
+    LT,
+    NOT,
+    RANGE,
+    SET,
+    Limit,
+    Offset
+)
 
 FieldName: typing.TypeAlias = str
 FieldType: typing.TypeAlias = type
@@ -24,30 +40,86 @@ class ParsingSchema:
     fieldset: str = 'fieldset'
 
 
+_BOOL_VALUES = {
+    'true': True,
+    'false': False,
+    'True': True,
+    'False': False
+}
+
+
 def _cast_bool(value: str):
-    value = value.strip().lower()
-    if value == 'false':
-        return False
-    elif value == 'true':
-        return True
+    if value in _BOOL_VALUES:
+        return _BOOL_VALUES[value]
+    return _BOOL_VALUES.get(value.strip().lower())
+
+
+@functools.lru_cache(maxsize=1024)
+def _cast_iso_datetime(value: str):
+    return datetime.datetime.fromisoformat(value)
+
+
+def _cast_datetime(value: str):
+    try:
+        return _cast_iso_datetime(value)
+    except ValueError:
+        # not cached: dateutil fills missing fields from the current date
+        return dateutil.parser.parse(value)
 
 
 default_casting_map = types.MappingProxyType({
-    datetime.datetime: dateutil.parser.parse,
+    datetime.datetime: _cast_datetime,
     datetime.date: datetime.date.fromisoformat,
     bool: _cast_bool
 })
 
-interval_types = (
+interval_types = frozenset((
     datetime.datetime,
     datetime.date,
     int,
     float
+))
+
+_QUERY_PAIR_PATTERN = re.compile(r'([^&=]+)=([^&]*)')
+
+_NOTATION_PREFIXES = '([{!~n'
+
+_FILTER_PATTERN = re.compile(
+    r'(?P<is_null>null)'
+    r'|(?P<not_null>!null)'
+    r'|\((?P<interval_oo>[\dTZ:\-,.]+)\)'
+    r'|\[(?P<interval_co>[\dTZ:\-,.]+)\)'
+    r'|\((?P<interval_oc>[\dTZ:\-,.]+)]'
+    r'|\[(?P<interval_cc>[\dTZ:\-,.]+)]'
+    r'|!{(?P<not_set>.*)}'
+    r'|{(?P<set>.*)}'
+    r'|~{2}(?P<like>.*)'
+    r'|![~]{2}(?P<not_like>.*)'
+    r'|~(?P<like_cs>.*)'
+    r'|!~(?P<not_like_cs>.*)'
+    r'|!(?P<ne>.*)'
+    r'|(?P<eq>.*)',
+    re.DOTALL
 )
 
 
-@dataclasses.dataclass
-class Param:
+def _split_query(query: str) -> collections.abc.Generator[tuple[str, str], None, None]:
+    # every pair must start where the previous one ended, right after its '&' separator
+    position = 0
+    for mo in _QUERY_PAIR_PATTERN.finditer(query):
+        if mo.start() != position:
+            break
+        yield mo.groups()
+        position = mo.end() + 1
+    if position != len(query) + 1:
+        raise ValueError('Query parameters must be separated by a single & and have names')
+
+
+def _case_sensitive_like(value: typing.Any) -> LIKE:
+    return LIKE(value, case_sensitive=True)
+
+
+class Param(typing.NamedTuple):
     name: str
     value: codex.query.ClauseBit
 
@@ -63,46 +135,66 @@ class Parser:
     ):
         self._casting_map = casting_map
         self._parsing_schema = parsing_schema
+        self._handlers = {
+            'is_null': self._is_null,
+            'not_null': self._not_null,
+            'interval_oo': self._interval_oo,
+            'interval_co': self._interval_co,
+            'interval_oc': self._interval_oc,
+            'interval_cc': self._interval_cc,
+            'not_set': self._not_set,
+            'set': self._set,
+            'like': self._like,
+            'not_like': self._not_like,
+            'like_cs': self._like_cs,
+            'not_like_cs': self._not_like_cs,
+            'ne': self._ne,
+            'eq': self._eq,
+        }
+
+    @classmethod
+    def cache_clear(cls):
+        _cast_iso_datetime.cache_clear()
 
     def __call__(
         self,
         query: QueryType,
         types_map: TypesMapType,
     ) -> collections.abc.Generator[tuple[str, codex.query.ClauseBit], None, None]:
+        yield from self.parse_all(query, types_map)
+
+    def parse_all(
+        self,
+        query: QueryType,
+        types_map: TypesMapType,
+    ) -> list[Param]:
         if isinstance(query, str):
             if '=' not in query:
                 raise ValueError('You have to specify name for parameter value')
-            query = (pairs.split('=') for pairs in query.split('&'))
+            pairs = _split_query(query)
         elif isinstance(query, collections.abc.Mapping):
-            query = query.items()
+            pairs = query.items()
         else:
             raise ValueError('Query mast be string or mapping')
-        for param in self._parse(query, types_map):
-            yield param.name, param.value
 
-    def _parse(
-        self,
-        query: QueryType,
-        types_map: TypesMapType
-    ):
-        for pair in query:
-            k, v = pair
+        order_by = self._parsing_schema.order_by
+        limit = self._parsing_schema.limit
+        offset = self._parsing_schema.offset
+        parse_filter = self._parse_filter_param
+        result = []
+        append = result.append
+        for k, v in pairs:
             if v is None:
                 continue
-            if k == self._parsing_schema.order_by:
-                yield from self._parse_order_param(v)
-            elif k == self._parsing_schema.limit:
-                yield Param(
-                    name=self._parsing_schema.limit,
-                    value=operators.Limit(int(v))
-                )
-            elif k == self._parsing_schema.offset:
-                yield Param(
-                    name=self._parsing_schema.offset,
-                    value=operators.Offset(int(v))
-                )
+            if k == order_by:
+                result.extend(self._parse_order_param(v))
+            elif k == limit:
+                append(Param(limit, Limit(int(v))))
+            elif k == offset:
+                append(Param(offset, Offset(int(v))))
             else:
-                yield self._parse_filter_param(k, v.strip(), types_map)
+                append(parse_filter(k, v.strip(), types_map))
+        return result
 
     @staticmethod
     def _parse_order_param(
@@ -110,14 +202,11 @@ class Parser:
     ) -> collections.abc.Generator[Param, None, None]:
         priority = 0
         for name in names.split(','):
-            direction = operators.ASC
+            direction = ASC
             if name.startswith('-'):
-                direction = operators.DESC
+                direction = DESC
                 name = name[1:]
-            yield Param(
-                name=name,
-                value=direction(priority)
-            )
+            yield Param(name, direction(priority))
             priority += 1
 
     def _parse_filter_param(
@@ -129,37 +218,85 @@ class Parser:
         if name not in types_map:
             raise Exception(f'Type of parameter {name} must be defined in types map')
 
-        for pattern, handler in self._pattern_handler_map(types_map).items():
-            if mo := pattern.search(value):
-                return handler(name, mo.group(1))
+        # plain equality is the most common case and cannot start with any notation prefix
+        if value and value[0] not in _NOTATION_PREFIXES:
+            return self._eq(name, value, types_map)
+
+        mo = _FILTER_PATTERN.fullmatch(value)
+        tag = mo.lastgroup
+        return self._handlers[tag](name, mo.group(tag), types_map)
+
+    def _is_null(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return Param(name, IS(None))
+
+    def _not_null(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return Param(name, NOT(IS(None)))
+
+    def _interval_oo(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._interval(name, value, (GT, LT), types_map)
+
+    def _interval_co(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._interval(name, value, (GE, LT), types_map)
+
+    def _interval_oc(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._interval(name, value, (GT, LE), types_map)
+
+    def _interval_cc(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._interval(name, value, (GE, LE), types_map)
+
+    def _not_set(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._multitude(name, value, types_map, inversion=True)
+
+    def _set(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._multitude(name, value, types_map)
+
+    def _like(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._literal(name, value, LIKE, types_map)
+
+    def _not_like(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._literal(name, value, LIKE, types_map, inversion=True)
+
+    def _like_cs(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._literal(name, value, _case_sensitive_like, types_map)
+
+    def _not_like_cs(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._literal(name, value, _case_sensitive_like, types_map, inversion=True)
+
+    def _ne(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._literal(name, value, EQ, types_map, inversion=True)
+
+    def _eq(self, name: FieldName, value: str, types_map: TypesMapType) -> Param:
+        return self._literal(name, value, EQ, types_map)
 
     def _interval(
         self,
         field_name: str,
         field_value: str,
         operations: tuple[
-            type[operators.GT | operators.GE],
-            type[operators.LT | operators.LE]
+            type[GT | GE],
+            type[LT | LE]
         ],
         types_map: TypesMapType
     ) -> Param:
-        if types_map[field_name] not in interval_types:
+        type_ = types_map[field_name]
+        if type_ not in interval_types:
             raise TypeError(
-                f'Interval cannot be calculated for type {types_map[field_name]} for field {field_name}')
+                f'Interval cannot be calculated for type {type_} for field {field_name}')
 
-        _data = field_value.split(',')
-        if len(_data) != 2:
+        comma = field_value.find(',')
+        if comma < 0 or field_value.find(',', comma + 1) >= 0:
             raise ValueError(f'Range must contain strictly two members for field {field_name}')
 
+        caster = self._casting_map.get(type_, type_)
         left = None
         right = None
-        if _data[0]:
-            left = operations[0](self._cast(_data[0], types_map[field_name]))
-        if _data[1]:
-            right = operations[1](self._cast(_data[1], types_map[field_name]))
-        value = operators.RANGE(left, right)
+        if comma > 0:
+            left = operations[0](caster(field_value[:comma]))
+        if comma < len(field_value) - 1:
+            right = operations[1](caster(field_value[comma + 1:]))
+        value = RANGE(left, right)
 
-        return Param(name=field_name, value=value)
+        return Param(field_name, value)
 
     def _multitude(
         self,
@@ -168,115 +305,29 @@ class Parser:
         types_map: TypesMapType,
         inversion: bool = False,
     ):
-        field_value = operators.SET(
-            *(
-                self._cast(v, types_map[field_name])
-                for v in field_value.split(',')
-                if v
-            )
+        type_ = types_map[field_name]
+        caster = self._casting_map.get(type_, type_)
+        field_value = SET(
+            *[caster(v) for v in field_value.split(',') if v]
         )
 
         if inversion:
-            field_value = operators.NOT(field_value)
+            field_value = NOT(field_value)
 
-        return Param(
-            name=field_name,
-            value=field_value
-        )
+        return Param(field_name, field_value)
 
     def _literal(
         self,
         field_name: str,
         field_value: str,
-        operation: type[operators.FilterBit],
+        operation: collections.abc.Callable[[typing.Any], codex.query.FilterBit],
         types_map: TypesMapType,
         inversion: bool = False
     ):
-        field_value = operation(self._cast(field_value, types_map[field_name]))
+        type_ = types_map[field_name]
+        field_value = operation(self._casting_map.get(type_, type_)(field_value))
 
         if inversion:
-            field_value = operators.NOT(field_value)
+            field_value = NOT(field_value)
 
-        return Param(
-            name=field_name,
-            value=field_value,
-        )
-
-    def _cast(self, value: str, type_: type):
-        if cast := self._casting_map.get(type_):
-            return cast(value)
-        return type_(value)
-
-    def _pattern_handler_map(self, types_map: TypesMapType):
-        return {
-            re.compile('^(null)$'): lambda x, y: Param(name=x, value=operators.IS(None)),
-            re.compile('^(!null)$'): lambda x, y: Param(name=x, value=operators.NOT(operators.IS(None))),
-            re.compile(r'^\(([\dTZ:\-,.]+)\)$'): functools.partial(
-                self._interval,
-                operations=(operators.GT, operators.LT),
-                types_map=types_map
-            ),
-            re.compile(r'^\[([\dTZ:\-,.]+)\)$'): functools.partial(
-                self._interval,
-                operations=(operators.GE, operators.LT),
-                types_map=types_map
-            ),
-            re.compile(r'^\(([\dTZ:\-,.]+)]$'): functools.partial(
-                self._interval,
-                operations=(operators.GT, operators.LE),
-                types_map=types_map
-            ),
-            re.compile(r'^\[([\dTZ:\-,.]+)]$'): functools.partial(
-                self._interval,
-                operations=(operators.GE, operators.LE),
-                types_map=types_map
-            ),
-            re.compile(r'^!{(.*)}$'): functools.partial(
-                self._multitude,
-                inversion=True,
-                types_map=types_map
-            ),
-            re.compile(r'^{(.*)}$'): functools.partial(
-                self._multitude,
-                types_map=types_map
-            ),
-            re.compile(r'^~{2}(.*)$'): functools.partial(
-                self._literal,
-                operation=operators.LIKE,
-                types_map=types_map
-            ),
-            re.compile(r'^![~]{2}(.*)$'): functools.partial(
-                self._literal,
-                operation=operators.LIKE,
-                inversion=True,
-                types_map=types_map
-            ),
-            re.compile(r'^~(.*)$'): functools.partial(
-                self._literal,
-                operation=functools.partial(  # type: ignore[arg-type]
-                    operators.LIKE,
-                    case_sensitive=True
-                ),
-                types_map=types_map
-            ),
-            re.compile(r'^!~(.*)$'): functools.partial(
-                self._literal,
-                operation=functools.partial(  # type: ignore[arg-type]
-                    operators.LIKE,
-                    case_sensitive=True
-                ),
-                inversion=True,
-                types_map=types_map
-            ),
-            re.compile(r'^!(.*)$'): functools.partial(
-                self._literal,
-                operation=operators.EQ,
-                inversion=True,
-                types_map=types_map
-            ),
-            re.compile(r'(.*)'): functools.partial(
-                self._literal,
-                operation=operators.EQ,
-                types_map=types_map
-            )
-        }
+        return Param(field_name, field_value)